@@ -1,6 +1,13 @@
+import os
+import sys
 import pygame
 from random import *
 
+asset_dir = os.path.dirname(os.path.abspath(__file__))
+if os.path.dirname(asset_dir) not in sys.path:
+    sys.path.insert(0, os.path.dirname(asset_dir))
+from py_frame_profiler import FrameProfiler, PHASE_EVENT, PHASE_UPDATE, PHASE_DRAW, PHASE_FLIP
+
 pygame.init()
 
 screen_width = 480
@@ -17,9 +24,9 @@ clock = pygame.time.Clock()
 #########################
 
 
-background = pygame.image.load("C:/PythonGame/py_AvoidGame/background.png")
+background = pygame.image.load(os.path.join(asset_dir, "background.png"))
 
-character = pygame.image.load("C:/PythonGame/py_AvoidGame/character.png")
+character = pygame.image.load(os.path.join(asset_dir, "character.png"))
 character_size = character.get_rect().size
 character_width = character_size[0]
 character_height = character_size[1]
@@ -28,7 +35,7 @@ character_y = screen_height - character_height
 
 to_x = 0
 
-enemy = pygame.image.load("C:/PythonGame/py_AvoidGame/enemy.png")
+enemy = pygame.image.load(os.path.join(asset_dir, "enemy.png"))
 enemy_size = enemy.get_rect().size
 enemy_width = enemy_size[0]
 enemy_height = enemy_size[1]
@@ -45,6 +52,9 @@ total_time = 30
 start_ticks = pygame.time.get_ticks()
 enemy_count = 10
 
+# 프레임 프로파일러 (GAME_PROFILE 환경변수로 활성화, F3 으로 오버레이 토글)
+profiler = FrameProfiler.from_env()
+
 ##########################
 # 2. 이벤트 처리 (키보드, 마우스 등)
 ##########################
@@ -53,8 +63,10 @@ enemy_count = 10
 running = True
 while running:
     dt = clock.tick(30)
+    profiler.begin_frame()
     
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
         if event.type == pygame.KEYDOWN:
@@ -65,6 +77,7 @@ while running:
         if event.type == pygame.KEYUP:
             if event.key == pygame.K_LEFT or event.key == pygame.K_RIGHT:
                 to_x = 0
+    profiler.mark(PHASE_EVENT)
                 
                 
     character_x += to_x * dt
@@ -99,6 +112,7 @@ while running:
     if enemy_count == 1 and enemy_y_pos == screen_height:
         print("게임 클리어!")
         running = False
+    profiler.mark(PHASE_UPDATE)
         
         
     screen.blit(background, (0, 0))
@@ -121,8 +135,11 @@ while running:
         mission_clear_size = mission_clear_render.get_rect().size
         mission_clear_width = mission_clear_size[0]
         screen.blit(mission_clear_render, ((screen_width / 2) - (mission_clear_width / 2), screen_height / 2))
+    profiler.draw_overlay(screen)
+    profiler.mark(PHASE_DRAW)
     
     pygame.display.update()
+    profiler.mark(PHASE_FLIP)
     
 pygame.time.delay(2000)
 pygame.quit()
\ No newline at end of file
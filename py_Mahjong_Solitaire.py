@@ -14,6 +14,7 @@ Mouse   : click two tiles to try removing them
 H key   : show a hint (flashes a removable pair)
 S key   : shuffle the remaining tiles
 Esc key : quit game
+F3 key  : toggle the frame profiler overlay (when GAME_PROFILE is set)
 
 Notes
 -----
@@ -32,6 +33,8 @@ import pygame
 from collections import deque
 from typing import List, Optional, Tuple
 
+from py_frame_profiler import FrameProfiler, PHASE_EVENT, PHASE_UPDATE, PHASE_DRAW, PHASE_FLIP
+
 # ───────────────────────────────── Configuration ─────────────────────────────
 CELL        = 48             # pixel size of a board cell
 INNER_W     = 14             # inner grid width (even)
@@ -209,11 +212,14 @@ def main():
     selection: Optional[Vec] = None
     hint_pair: Optional[Tuple[Vec, Vec]] = None
     hint_timer = 0
+    profiler = FrameProfiler.from_env()
 
     running = True
     while running:
         dt = clock.tick(FPS)
+        profiler.begin_frame()
         for event in pygame.event.get():
+            profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -248,19 +254,24 @@ def main():
                             board = generate_board()
                     else:
                         selection = (x, y)
+        profiler.mark(PHASE_EVENT)
 
         # Update hint timer
         if hint_timer > 0:
             hint_timer -= dt
             if hint_timer <= 0:
                 hint_pair = None
+        profiler.mark(PHASE_UPDATE)
 
         draw_board(screen, board, selection, hint_pair)
         # HUD text
         remain = sum(1 for row in board for t in row if t is not None)
         txt = font.render(f"Tiles left: {remain//2}", True, TEXT_COLOR)
         screen.blit(txt, (8, 8))
+        profiler.draw_overlay(screen)
+        profiler.mark(PHASE_DRAW)
         pygame.display.flip()
+        profiler.mark(PHASE_FLIP)
 
 
 def shuffle_board(board: Board) -> Board:
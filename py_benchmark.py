@@ -0,0 +1,345 @@
+"""
+Headless scripted-input benchmark harness – Pygame
+==================================================
+Runs every game in this repo without a window or a human and reports frame
+throughput and frame-time percentiles as JSON, so two versions can be diffed.
+
+How it works
+------------
+• SDL is forced onto the dummy video/audio drivers before pygame is imported.
+• pygame.time.Clock / get_ticks / delay are replaced by a virtual clock: tick()
+  returns the nominal frame time instantly, so loops run unthrottled while
+  game logic still sees time advancing at its usual rate.
+• pygame.event.get is replaced by a per-game input script (click sequences for
+  Sichuan, key sequences for snake and AvoidGame, timed clicks for the
+  reaction game). pygame.mouse.get_pos reports the last scripted click.
+• Every display flip/update is a frame. Wall time between flips is recorded;
+  after N frames the game is stopped. Games that end early are restarted until
+  the frame budget is spent.
+
+Usage
+-----
+    python py_benchmark.py                       # all games, JSON on stdout
+    python py_benchmark.py -n 5000 -o new.json   # 5000 frames per game
+    python py_benchmark.py -g snake sichuan      # subset of games
+    python py_benchmark.py -o new.json --baseline old.json
+
+Input scripts are seeded (--seed), so a given version replays identical input.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import runpy
+import sys
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+import py_Mahjong_Solitaire as sichuan
+import py_snake_rules as snake_rules
+from py_frame_profiler import percentile
+
+# ───────────────────────────────── Configuration ─────────────────────────────
+ROOT           = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FRAMES = 2000
+DEFAULT_SEED   = 1234
+STALL_POLLS    = 100_000     # event polls without a flip before giving up
+REPORT_VERSION = 1
+
+Event = pygame.event.Event
+Script = Callable[[int, random.Random], List[Event]]
+
+# ───────────────────────────────── Input Scripts ─────────────────────────────
+
+def _key(key: int, down: bool = True) -> Event:
+    return Event(pygame.KEYDOWN if down else pygame.KEYUP, key=key, mod=0, unicode="")
+
+
+def _click(pos: Tuple[int, int]) -> Event:
+    return Event(pygame.MOUSEBUTTONDOWN, button=1, pos=pos)
+
+
+def sichuan_script(poll: int, rng: random.Random) -> List[Event]:
+    """Click a random inner tile every other poll; hint and shuffle now and then."""
+    if poll % 400 == 399:
+        return [_key(pygame.K_s)]
+    if poll % 60 == 59:
+        return [_key(pygame.K_h)]
+    if poll % 2:
+        return []
+    x = rng.randrange(sichuan.BORDER, sichuan.BORDER + sichuan.INNER_W)
+    y = rng.randrange(sichuan.BORDER, sichuan.BORDER + sichuan.INNER_H)
+    return [_click((x * sichuan.CELL + sichuan.CELL // 2, y * sichuan.CELL + sichuan.CELL // 2))]
+
+
+def _snake_cycle_dir(x: int, y: int) -> int:
+    """Direction index of a Hamiltonian cycle: boustrophedon rows, column 0 returns."""
+    w, h = snake_rules.GRID_WIDTH, snake_rules.GRID_HEIGHT  # h must be even
+    if x == 0:
+        return 0 if y > 0 else 1                       # up the return column
+    if y == 0:
+        return 1 if x < w - 1 else 2                   # top row: right, then down
+    if y % 2:
+        return 3 if x > 1 else (2 if y < h - 1 else 3)  # odd rows sweep left
+    return 1 if x < w - 1 else 2                       # even rows sweep right
+
+
+def _snake_cycle_keys() -> List[int]:
+    """Key to press on each tick, walking the cycle from the snake's start cell."""
+    keys = (pygame.K_UP, pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT)
+    x, y = snake_rules.START_POS
+    out = []
+    for _ in range(snake_rules.GRID_WIDTH * snake_rules.GRID_HEIGHT):
+        d = _snake_cycle_dir(x, y)
+        out.append(keys[d])
+        dx, dy = snake_rules.DIRECTIONS[d]
+        x, y = x + dx, y + dy
+    return out
+
+
+SNAKE_CYCLE_KEYS = _snake_cycle_keys()
+
+
+def snake_script(poll: int, rng: random.Random) -> List[Event]:
+    """Follow a Hamiltonian cycle so the snake never dies and keeps growing."""
+    return [_key(SNAKE_CYCLE_KEYS[poll % len(SNAKE_CYCLE_KEYS)])]
+
+
+def avoid_script(poll: int, rng: random.Random) -> List[Event]:
+    """Hold left or right for a short while, release, repeat."""
+    phase = poll % 24
+    if phase == 0:
+        return [_key(rng.choice((pygame.K_LEFT, pygame.K_RIGHT)))]
+    if phase == 12:
+        return [_key(pygame.K_LEFT, down=False)]
+    return []
+
+
+def reaction_script(poll: int, rng: random.Random) -> List[Event]:
+    """Click at irregular intervals so both false starts and reactions occur."""
+    if rng.random() < 1 / 90:
+        return [_click((400, 300))]
+    return []
+
+
+def bubble_script(poll: int, rng: random.Random) -> List[Event]:
+    """The bubble demo takes no input."""
+    return []
+
+
+# name → (script path relative to ROOT, input script)
+GAMES: Dict[str, Tuple[str, Script]] = {
+    "sichuan":  ("py_Mahjong_Solitaire.py", sichuan_script),
+    "snake":    ("py_snake_game.py", snake_script),
+    "avoid":    (os.path.join("py_AvoidGame", "AvoidGame.py"), avoid_script),
+    "reaction": ("py_reaction_game.py", reaction_script),
+    "bubble":   ("py_bubble.py", bubble_script),
+}
+
+# ───────────────────────────────── Harness ───────────────────────────────────
+
+class _FramesDone(Exception):
+    """Raised from the patched flip once the frame budget is spent."""
+
+
+class _Session:
+    """Patched pygame entry points plus the frame-time log for one game."""
+
+    def __init__(self, script: Script, frames: int, seed: int):
+        self.script = script
+        self.frames = frames
+        self.rng = random.Random(seed)
+        self.poll = 0
+        self.polls_since_flip = 0
+        self.virtual_ms = 0.0
+        self.mouse_pos = (0, 0)
+        self.frame_ms: List[float] = []
+        self.last_flip: Optional[float] = None
+        self.saved: List[Tuple[object, str, object]] = []
+
+    # ───── Virtual time ─────
+    def get_ticks(self) -> int:
+        return int(self.virtual_ms)
+
+    def delay(self, ms: int) -> int:
+        self.virtual_ms += ms
+        return ms
+
+    def make_clock(self):
+        session = self
+
+        class VirtualClock:
+            def __init__(self):
+                self.last_ms = 0
+
+            def tick(self, framerate: float = 0) -> int:
+                self.last_ms = int(1000 / framerate) if framerate else 0
+                session.virtual_ms += self.last_ms
+                return self.last_ms
+
+            tick_busy_loop = tick
+
+            def get_time(self) -> int:
+                return self.last_ms
+
+            def get_fps(self) -> float:
+                return 1000.0 / self.last_ms if self.last_ms else 0.0
+
+        return VirtualClock
+
+    # ───── Scripted input ─────
+    def get_events(self, *args, **kwargs) -> List[Event]:
+        self._real_get()  # drain the (empty) dummy queue
+        if self.last_flip is None:
+            self.last_flip = perf_counter()  # first poll of a run: setup is over
+        self.polls_since_flip += 1
+        if self.polls_since_flip > STALL_POLLS:
+            raise RuntimeError(f"no frame presented after {STALL_POLLS} event polls")
+        events = self.script(self.poll, self.rng)
+        self.poll += 1
+        for event in events:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self.mouse_pos = event.pos
+        return events
+
+    def get_mouse_pos(self) -> Tuple[int, int]:
+        return self.mouse_pos
+
+    # ───── Frame accounting ─────
+    def present(self, original: Callable, *args):
+        result = original(*args)
+        now = perf_counter()
+        if self.last_flip is not None:
+            self.frame_ms.append((now - self.last_flip) * 1000.0)
+        self.last_flip = now
+        self.polls_since_flip = 0
+        if len(self.frame_ms) >= self.frames:
+            raise _FramesDone
+        return result
+
+    # ───── Patching ─────
+    def _patch(self, owner, name: str, value) -> None:
+        self.saved.append((owner, name, getattr(owner, name)))
+        setattr(owner, name, value)
+
+    def __enter__(self) -> "_Session":
+        flip, update = pygame.display.flip, pygame.display.update
+        self._real_get = pygame.event.get
+        self._patch(pygame.time, "Clock", self.make_clock())
+        self._patch(pygame.time, "get_ticks", self.get_ticks)
+        self._patch(pygame.time, "delay", self.delay)
+        self._patch(pygame.time, "wait", self.delay)
+        self._patch(pygame.event, "get", self.get_events)
+        self._patch(pygame.mouse, "get_pos", self.get_mouse_pos)
+        self._patch(pygame.display, "flip", lambda: self.present(flip))
+        self._patch(pygame.display, "update", lambda *a: self.present(update, *a))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        for owner, name, value in reversed(self.saved):
+            setattr(owner, name, value)
+        self.saved.clear()
+
+
+def run_game(name: str, frames: int, seed: int) -> Dict[str, object]:
+    """Run one game for `frames` frames under scripted input and summarise it."""
+    path, script = GAMES[name]
+    path = os.path.join(ROOT, path)
+    random.seed(seed)
+    runs = 0
+    sink = io.StringIO()
+    with _Session(script, frames, seed) as session, contextlib.redirect_stdout(sink):
+        start = perf_counter()
+        while len(session.frame_ms) < frames:
+            before = len(session.frame_ms)
+            runs += 1
+            session.last_flip = None
+            try:
+                runpy.run_path(path, run_name="__main__")
+            except (_FramesDone, SystemExit):
+                pass
+            if len(session.frame_ms) == before:
+                raise RuntimeError(f"{name}: a run ended without presenting a frame")
+        elapsed = perf_counter() - start
+    pygame.quit()
+
+    samples = sorted(session.frame_ms)
+    busy_s = sum(samples) / 1000.0
+    return {
+        "frames": len(samples),
+        "runs": runs,
+        "wall_s": round(elapsed, 4),
+        "fps": round(len(samples) / busy_s, 2) if busy_s else 0.0,
+        "frame_ms": {
+            "mean": round(sum(samples) / len(samples), 4),
+            "p50": round(percentile(samples, 50), 4),
+            "p90": round(percentile(samples, 90), 4),
+            "p99": round(percentile(samples, 99), 4),
+            "max": round(samples[-1], 4),
+        },
+    }
+
+
+def build_report(names: List[str], frames: int, seed: int) -> Dict[str, object]:
+    return {
+        "version": REPORT_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "platform": platform.platform(),
+        },
+        "config": {"frames": frames, "seed": seed},
+        "games": {name: run_game(name, frames, seed) for name in names},
+    }
+
+
+def compare(report: Dict[str, object], baseline: Dict[str, object]) -> str:
+    """Human-readable FPS / p99 deltas of `report` against `baseline`."""
+    lines = [f"{'game':<10} {'fps':>10} {'Δfps':>8} {'p99 ms':>9} {'Δp99':>8}"]
+    for name, new in report["games"].items():
+        old = baseline.get("games", {}).get(name)
+        if old is None:
+            lines.append(f"{name:<10} {new['fps']:>10.1f} {'new':>8}")
+            continue
+        d_fps = (new["fps"] / old["fps"] - 1) * 100 if old["fps"] else 0.0
+        d_p99 = (new["frame_ms"]["p99"] / old["frame_ms"]["p99"] - 1) * 100 if old["frame_ms"]["p99"] else 0.0
+        lines.append(f"{name:<10} {new['fps']:>10.1f} {d_fps:>+7.1f}% "
+                     f"{new['frame_ms']['p99']:>9.3f} {d_p99:>+7.1f}%")
+    return "\n".join(lines)
+
+# ────────────────────────────────── Entry Point ──────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Headless benchmark for all games.")
+    parser.add_argument("-n", "--frames", type=int, default=DEFAULT_FRAMES, help="frames per game")
+    parser.add_argument("-g", "--games", nargs="+", choices=sorted(GAMES), default=list(GAMES))
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="input script / game RNG seed")
+    parser.add_argument("-o", "--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--baseline", help="previous JSON report to compare against (printed to stderr)")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.games, args.frames, args.seed)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            print(compare(report, json.load(f)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
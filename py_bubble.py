@@ -1,18 +1,27 @@
 import pygame
+from py_frame_profiler import FrameProfiler, PHASE_EVENT, PHASE_DRAW, PHASE_FLIP
 pygame.init()
 
 screen = pygame.display.set_mode([500,500])
 
+profiler = FrameProfiler.from_env()
+
 running = True
 while running:
+    profiler.begin_frame()
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             running = False
+    profiler.mark(PHASE_EVENT)
             
     screen.fill((255, 255, 255))
     
     pygame.draw.circle(screen, (0,0,225),(250,250), 75)
+    profiler.draw_overlay(screen)
+    profiler.mark(PHASE_DRAW)
     
     pygame.display.flip()
+    profiler.mark(PHASE_FLIP)
     
 pygame.quit()
\ No newline at end of file
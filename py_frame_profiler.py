@@ -0,0 +1,226 @@
+"""
+Per-phase frame profiler – Pygame
+=================================
+A tiny instrumentation hook shared by every game loop in this repo. Each frame
+is split into four phases – event handling, update, draw and flip – and their
+durations are stored in a fixed-size ring buffer (no allocation per frame).
+
+Usage inside a game loop
+------------------------
+    profiler = FrameProfiler.from_env()
+    while running:
+        clock.tick(FPS)
+        profiler.begin_frame()
+        for event in pygame.event.get():
+            profiler.handle_event(event)
+            ...
+        profiler.mark(PHASE_EVENT)
+        ...update...
+        profiler.mark(PHASE_UPDATE)
+        ...draw...
+        profiler.draw_overlay(screen)
+        profiler.mark(PHASE_DRAW)
+        pygame.display.flip()
+        profiler.mark(PHASE_FLIP)
+
+Environment
+-----------
+GAME_PROFILE        : unset / "0" → disabled (every hook returns immediately)
+                      "1"         → enabled, no dump
+                      <path>      → enabled, buffer dumped on exit
+                                    (.json → JSON, anything else → CSV)
+GAME_PROFILE_FRAMES : ring buffer capacity in frames (default 600; used if unparsable)
+
+Controls
+--------
+F3 key : toggle the p50/p99/FPS overlay (only when profiling is enabled)
+"""
+
+import atexit
+import csv
+import json
+import math
+import os
+from time import perf_counter
+from typing import Dict, List, Optional
+
+import pygame
+
+# ───────────────────────────────── Configuration ─────────────────────────────
+DEFAULT_CAPACITY  = 600        # frames kept in the ring buffer (~10 s at 60 FPS)
+OVERLAY_REFRESH   = 30         # frames between overlay statistic refreshes
+OVERLAY_KEY       = pygame.K_F3
+OVERLAY_BG        = (0, 0, 0, 160)
+OVERLAY_TEXT      = (255, 255, 0)
+
+PHASE_EVENT  = 0
+PHASE_UPDATE = 1
+PHASE_DRAW   = 2
+PHASE_FLIP   = 3
+PHASE_NAMES  = ("event", "update", "draw", "flip")
+
+# ───────────────────────────────── Statistics ────────────────────────────────
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100.0 * len(sorted_values)) - 1
+    return sorted_values[min(max(rank, 0), len(sorted_values) - 1)]
+
+# ───────────────────────────────── Profiler ──────────────────────────────────
+
+class FrameProfiler:
+    """Ring-buffered per-phase frame timer with an optional on-screen overlay."""
+
+    def __init__(self, enabled: bool = False, capacity: int = DEFAULT_CAPACITY,
+                 dump_path: Optional[str] = None):
+        self.enabled = enabled
+        self.overlay = False
+        self.dump_path = dump_path
+        self.capacity = max(1, capacity)      # completed frames kept
+        if not enabled:
+            return
+
+        # One preallocated column per phase plus work time and wall interval.
+        # The extra slot holds the frame in progress, so `capacity` finished ones fit.
+        self.slots = self.capacity + 1
+        self.phases = [[0.0] * self.slots for _ in PHASE_NAMES]
+        self.work = [0.0] * self.slots        # sum of phases (ms)
+        self.wall = [0.0] * self.slots        # begin_frame → begin_frame (ms)
+        self.count = 0                        # frames recorded in total
+        self.index = -1                       # slot of the current frame
+        self.frame_start = 0.0
+        self.last_mark = 0.0
+        self.stats: Dict[str, float] = {}
+        self.font: Optional[pygame.font.Font] = None
+
+        if dump_path:
+            atexit.register(self.dump)
+
+    @classmethod
+    def from_env(cls) -> "FrameProfiler":
+        """Build a profiler configured from GAME_PROFILE / GAME_PROFILE_FRAMES."""
+        setting = os.environ.get("GAME_PROFILE", "").strip()
+        if setting in ("", "0"):
+            return cls(enabled=False)
+        try:
+            capacity = int(os.environ.get("GAME_PROFILE_FRAMES", DEFAULT_CAPACITY))
+        except ValueError:
+            capacity = DEFAULT_CAPACITY  # a typo must never stop the game from starting
+        dump_path = None if setting == "1" else setting
+        return cls(enabled=True, capacity=capacity, dump_path=dump_path)
+
+    # ───── Per-frame hooks ─────
+    def begin_frame(self) -> None:
+        """Start timing a new frame; call once per loop iteration."""
+        if not self.enabled:
+            return
+        now = perf_counter()
+        if self.index >= 0:
+            self.wall[self.index] = (now - self.frame_start) * 1000.0
+        self.index = self.count % self.slots
+        self.count += 1
+        for column in self.phases:
+            column[self.index] = 0.0
+        self.work[self.index] = 0.0
+        self.wall[self.index] = 0.0
+        self.frame_start = now
+        self.last_mark = now
+
+    def mark(self, phase: int) -> None:
+        """Close `phase`, charging it the time elapsed since the previous mark."""
+        if not self.enabled or self.index < 0:
+            return
+        now = perf_counter()
+        elapsed = (now - self.last_mark) * 1000.0
+        self.phases[phase][self.index] += elapsed
+        self.work[self.index] += elapsed
+        self.last_mark = now
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Toggle the overlay on F3; every other event is ignored."""
+        if not self.enabled:
+            return
+        if event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:
+            self.overlay = not self.overlay
+            self.stats = {}
+
+    # ───── Overlay ─────
+    def summary(self) -> Dict[str, float]:
+        """Return p50/p99 work time, p99 wall time and FPS over the buffer."""
+        if not self.enabled:
+            return {}
+        # The slot of the current frame is still being filled; skip it
+        slots = [i for i in range(min(self.count, self.slots)) if i != self.index]
+        if not slots:
+            return {"frames": 0, "p50_ms": 0.0, "p99_ms": 0.0, "wall_p99_ms": 0.0, "fps": 0.0}
+        work = sorted(self.work[i] for i in slots)
+        wall = sorted(self.wall[i] for i in slots)
+        mean_wall = sum(wall) / len(wall)
+        return {
+            "frames": len(slots),
+            "p50_ms": percentile(work, 50),
+            "p99_ms": percentile(work, 99),
+            "wall_p99_ms": percentile(wall, 99),
+            "fps": 1000.0 / mean_wall if mean_wall > 0 else 0.0,
+        }
+
+    def draw_overlay(self, surface: pygame.Surface) -> None:
+        """Blit the statistics box in the top-right corner when toggled on."""
+        if not self.enabled or not self.overlay:
+            return
+        if not self.stats or self.count % OVERLAY_REFRESH == 0:
+            self.stats = self.summary()
+        if self.font is None:
+            self.font = pygame.font.SysFont("consolas", 16, bold=True)
+        lines = [
+            f"FPS  {self.stats['fps']:6.1f}",
+            f"p50  {self.stats['p50_ms']:6.2f} ms",
+            f"p99  {self.stats['p99_ms']:6.2f} ms",
+        ]
+        rendered = [self.font.render(line, True, OVERLAY_TEXT) for line in lines]
+        box_w = max(r.get_width() for r in rendered) + 12
+        box_h = sum(r.get_height() for r in rendered) + 8
+        box = pygame.Surface((box_w, box_h), pygame.SRCALPHA)
+        box.fill(OVERLAY_BG)
+        y = 4
+        for r in rendered:
+            box.blit(r, (6, y))
+            y += r.get_height()
+        surface.blit(box, (surface.get_width() - box_w - 4, 4))
+
+    # ───── Export ─────
+    def rows(self) -> List[Dict[str, float]]:
+        """Return the buffered frames oldest-first as dictionaries."""
+        if not self.enabled or self.count == 0:
+            return []
+        size = min(self.count, self.slots)
+        first = self.count - size
+        out = []
+        # The last frame (slot self.index) is still in progress; skip it like summary()
+        for frame in range(first, self.count - 1):
+            i = frame % self.slots
+            row = {"frame": frame}
+            for p, name in enumerate(PHASE_NAMES):
+                row[f"{name}_ms"] = round(self.phases[p][i], 4)
+            row["work_ms"] = round(self.work[i], 4)
+            row["wall_ms"] = round(self.wall[i], 4)
+            out.append(row)
+        return out
+
+    def dump(self, path: Optional[str] = None) -> None:
+        """Write the buffer to `path` (or the configured dump path) as CSV/JSON."""
+        path = path or self.dump_path
+        if not self.enabled or not path:
+            return
+        rows = self.rows()
+        if path.lower().endswith(".json"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.summary(), "frames": rows}, f, indent=1)
+        else:
+            fields = ["frame"] + [f"{name}_ms" for name in PHASE_NAMES] + ["work_ms", "wall_ms"]
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(rows)
@@ -4,6 +4,8 @@ import random
 import time
 from pathlib import Path
 
+from py_frame_profiler import FrameProfiler, PHASE_EVENT, PHASE_UPDATE, PHASE_DRAW, PHASE_FLIP
+
 ## 인터페이스 구성 ##
 width, height = 800, 600
 bg_color_wait = (30, 30, 30)
@@ -40,12 +42,17 @@ false_start = False
 
 best_time = None
 
+# 프레임 프로파일러 (GAME_PROFILE 환경변수로 활성화, F3 으로 오버레이 토글)
+profiler = FrameProfiler.from_env()
+
 
 ## 게임 루프 시작 ##
 while True:
     dt = clock.tick(60)
+    profiler.begin_frame()
     
     for event in pygame.event.get():
+        profiler.handle_event(event)
         if event.type == pygame.QUIT:
             pygame.quit()
             sys.exit()
@@ -74,6 +81,7 @@ while True:
                 ready_start_time = pygame.time.get_ticks()
                 random_delay = random.randint(*random_delay_range)
                 false_start = False
+    profiler.mark(PHASE_EVENT)
                 
                 
                 
@@ -83,6 +91,7 @@ while True:
         if current_ticks - ready_start_time >= random_delay:
             state = state_go
             reaction_start_tim = pygame.time.get_ticks()
+    profiler.mark(PHASE_UPDATE)
             
     # 렌더링 
     if state == state_wait:
@@ -111,5 +120,8 @@ while True:
         draw_centered(font_medium.render("Click to Restart", True, (255, 255, 255)), height - 50)
         if best_time is not None:
             draw_centered(font_medium.render(f"Best Time: {best_time:.3f} seconds", True, (150, 200, 150)), height - 100)
+    profiler.draw_overlay(screen)
+    profiler.mark(PHASE_DRAW)
             
-    pygame.display.flip()
\ No newline at end of file
+    pygame.display.flip()
+    profiler.mark(PHASE_FLIP)
\ No newline at end of file
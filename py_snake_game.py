@@ -1,13 +1,17 @@
 import pygame
 import sys
 import random
+from typing import Optional
+
+import py_snake_replay
+from py_snake_rules import (GRID_WIDTH, GRID_HEIGHT, START_POS, DIRECTIONS, START_DIR,
+                            STEP_ATE, STEP_DEAD, random_food_position, step_snake)
+from py_frame_profiler import FrameProfiler, PHASE_EVENT, PHASE_UPDATE, PHASE_DRAW, PHASE_FLIP
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Configuration constants
 # ──────────────────────────────────────────────────────────────────────────────
 CELL_SIZE     = 20         # pixel size of each grid cell
-GRID_WIDTH    = 30         # number of cells horizontally
-GRID_HEIGHT   = 30         # number of cells vertically
 SCREEN_WIDTH  = CELL_SIZE * GRID_WIDTH
 SCREEN_HEIGHT = CELL_SIZE * GRID_HEIGHT
 FPS_BASE      = 10         # initial frames per second (game speed)
@@ -32,12 +36,26 @@ def draw_grid(surface: pygame.Surface) -> None:
         pygame.draw.line(surface, COLOR_GRID, (0, y), (SCREEN_WIDTH, y))
 
 
-def random_food_position(snake: list[tuple[int, int]]) -> tuple[int, int]:
-    """Return a random grid position not currently occupied by the snake."""
-    while True:
-        pos = (random.randint(0, GRID_WIDTH - 1), random.randint(0, GRID_HEIGHT - 1))
-        if pos not in snake:
-            return pos
+def draw_board(surface: pygame.Surface, snake: list[tuple[int, int]], food: tuple[int, int]) -> None:
+    """Draw background, grid, food and snake."""
+    surface.fill(COLOR_BG)
+    draw_grid(surface)
+
+    # Draw food
+    pygame.draw.rect(
+        surface,
+        COLOR_FOOD,
+        pygame.Rect(food[0] * CELL_SIZE, food[1] * CELL_SIZE, CELL_SIZE, CELL_SIZE),
+    )
+
+    # Draw snake segments
+    for i, (x, y) in enumerate(snake):
+        color = COLOR_SNAKE_HEAD if i == 0 else COLOR_SNAKE_BODY
+        pygame.draw.rect(
+            surface,
+            color,
+            pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE).inflate(-2, -2),
+        )
 
 
 def draw_text(surface: pygame.Surface, text: str, size: int, center: tuple[int, int]):
@@ -50,26 +68,41 @@ def draw_text(surface: pygame.Surface, text: str, size: int, center: tuple[int,
 # Main game function
 # ──────────────────────────────────────────────────────────────────────────────
 
-def main() -> None:
+def main(profiler: Optional[FrameProfiler] = None) -> None:
+    # Frame profiler (disabled unless GAME_PROFILE is set; F3 toggles the overlay).
+    # Built here rather than at import time so importing this module (e.g. by the
+    # replay CLI for draw_board) never registers an exit-time dump; restarts reuse it.
+    if profiler is None:
+        profiler = FrameProfiler.from_env()
+
     pygame.init()
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Snake Game (Pygame)")
     clock = pygame.time.Clock()
 
+    # Every run is seeded and recorded so it can be replayed (see py_snake_replay)
+    seed = random.getrandbits(64)
+    rng = random.Random(seed)
+    recorder = py_snake_replay.SnakeRecorder.from_env(seed)
+
     # Initial snake and food setup
-    snake: list[tuple[int, int]] = [(GRID_WIDTH // 2, GRID_HEIGHT // 2)]
-    direction: tuple[int, int] = (0, -1)  # moving up initially
-    food: tuple[int, int] = random_food_position(snake)
+    snake: list[tuple[int, int]] = [START_POS]
+    direction: tuple[int, int] = DIRECTIONS[START_DIR]
+    food: tuple[int, int] = random_food_position(snake, rng)
+    recorder.food(food)
     score: int = 0
     speed: int = FPS_BASE
 
     running = True
     while running:
         clock.tick(speed)
+        profiler.begin_frame()
 
         # ───── Event handling ─────
         for event in pygame.event.get():
+            profiler.handle_event(event)
             if event.type == pygame.QUIT:
+                recorder.finish()
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
@@ -82,51 +115,36 @@ def main() -> None:
                 elif event.key in (pygame.K_RIGHT, pygame.K_d) and direction != (-1, 0):
                     direction = (1, 0)
                 elif event.key == pygame.K_r:  # restart on‑the‑fly
-                    return main()
+                    recorder.finish()
+                    return main(profiler)
+        profiler.mark(PHASE_EVENT)
 
         # ───── Update snake position ─────
-        head_x, head_y = snake[0]
-        new_head = ((head_x + direction[0]) % GRID_WIDTH,
-                    (head_y + direction[1]) % GRID_HEIGHT)
+        recorder.tick(DIRECTIONS.index(direction))
+        result = step_snake(snake, direction, food)
 
         # Collision with self → game over
-        if new_head in snake:
+        if result == STEP_DEAD:
+            recorder.finish()
             break
 
-        snake.insert(0, new_head)
-
-        # Check for food consumption
-        if new_head == food:
+        if result == STEP_ATE:
             score += 1
             speed = FPS_BASE + score // 5  # speed up every 5 points
-            food = random_food_position(snake)
-        else:
-            snake.pop()  # remove tail segment when no food eaten
+            food = random_food_position(snake, rng)
+            recorder.food(food)
+        profiler.mark(PHASE_UPDATE)
 
         # ───── Drawing section ─────
-        screen.fill(COLOR_BG)
-        draw_grid(screen)
-
-        # Draw food
-        pygame.draw.rect(
-            screen,
-            COLOR_FOOD,
-            pygame.Rect(food[0] * CELL_SIZE, food[1] * CELL_SIZE, CELL_SIZE, CELL_SIZE),
-        )
-
-        # Draw snake segments
-        for i, (x, y) in enumerate(snake):
-            color = COLOR_SNAKE_HEAD if i == 0 else COLOR_SNAKE_BODY
-            pygame.draw.rect(
-                screen,
-                color,
-                pygame.Rect(x * CELL_SIZE, y * CELL_SIZE, CELL_SIZE, CELL_SIZE).inflate(-2, -2),
-            )
+        draw_board(screen, snake, food)
 
         # Draw score
         draw_text(screen, f"Score: {score}", 24, (80, 20))
+        profiler.draw_overlay(screen)
+        profiler.mark(PHASE_DRAW)
 
         pygame.display.flip()
+        profiler.mark(PHASE_FLIP)
 
     # ──────────────────────────────────
     # Game‑over screen
@@ -144,7 +162,7 @@ def main() -> None:
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r:
-                    return main()
+                    return main(profiler)
                 elif event.key == pygame.K_q:
                     pygame.quit()
                     sys.exit()
@@ -0,0 +1,330 @@
+"""
+Snake replay recording & playback – Pygame
+==========================================
+Compact recordings of `py_snake_game.py` runs and a replay engine that can
+rebuild the board at any tick.
+
+Recording format (little-endian)
+--------------------------------
+  header : magic "SNKR", version, grid w/h, start x/y, start direction,
+           64-bit RNG seed, tick count, food spawn count
+  foods  : one uint16 cell index (y * GRID_WIDTH + x) per food spawn,
+           starting with the initial food
+  turns  : zlib-compressed stream of 2-bit codes, four ticks per byte.
+           Each code is the direction delta vs. the previous tick
+           (0 straight, 1 right turn, 2 reversal, 3 left turn). A reversal
+           happens when two turns are pressed within one frame (e.g. UP, then
+           LEFT, then DOWN). Most ticks are 0, so a 100k-tick game is ~25 KB
+           before zlib and much less after it.
+
+Replay engine
+-------------
+On load the whole game is simulated once with the shared step_snake() rule,
+and a snapshot is kept every SNAPSHOT_INTERVAL ticks. state_at(tick) copies
+the nearest earlier snapshot and simulates forward, so a seek costs at most
+one interval of ticks.
+
+Recording a game
+----------------
+    SNAKE_RECORD=runs/snake-{seed}.snk python py_snake_game.py
+
+Usage
+-----
+    python py_snake_replay.py run.snk                      # summary + fast-forward speed
+    python py_snake_replay.py run.snk --verify             # re-derive food spawns from the seed
+    python py_snake_replay.py run.snk --seek 50000 --screenshot late.png
+    python py_snake_replay.py run.snk --seek 50000 --render 2000   # draw-time percentiles
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import zlib
+from array import array
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+import pygame
+
+import py_snake_rules as rules
+from py_frame_profiler import percentile
+
+# ───────────────────────────────── Configuration ─────────────────────────────
+MAGIC             = b"SNKR"
+FORMAT_VERSION    = 1
+HEADER            = struct.Struct("<4sBBBBBBQII")
+SNAPSHOT_INTERVAL = 1024       # ticks between stored snapshots
+
+# byte → the four 2-bit turn codes it packs (lowest bits = earliest tick)
+_UNPACK = [tuple((b >> shift) & 3 for shift in (0, 2, 4, 6)) for b in range(256)]
+
+Vec = Tuple[int, int]
+
+# ───────────────────────────────── Recording ─────────────────────────────────
+
+class SnakeRecorder:
+    """Accumulates one run's direction stream and food spawns in memory."""
+
+    def __init__(self, seed: int, path: Optional[str] = None):
+        self.seed = seed
+        self.path = path
+        self.ticks = 0
+        self.prev_dir = rules.START_DIR
+        self.turns = bytearray()
+        self.foods = array("H")
+        self.finished = False
+
+    @classmethod
+    def from_env(cls, seed: int) -> "SnakeRecorder":
+        """Recorder saving to $SNAKE_RECORD on finish ("{seed}" is substituted)."""
+        path = os.environ.get("SNAKE_RECORD") or None
+        return cls(seed, path.replace("{seed}", str(seed)) if path else None)
+
+    def tick(self, direction: int) -> None:
+        """Record the direction index (into DIRECTIONS) used for this tick."""
+        slot = self.ticks & 3
+        if slot == 0:
+            self.turns.append(0)
+        self.turns[-1] |= ((direction - self.prev_dir) & 3) << (slot * 2)
+        self.prev_dir = direction
+        self.ticks += 1
+
+    def food(self, pos: Vec) -> None:
+        """Record a food spawn, including the initial one."""
+        self.foods.append(pos[1] * rules.GRID_WIDTH + pos[0])
+
+    def to_bytes(self) -> bytes:
+        start_x, start_y = rules.START_POS
+        header = HEADER.pack(MAGIC, FORMAT_VERSION, rules.GRID_WIDTH, rules.GRID_HEIGHT,
+                             start_x, start_y, rules.START_DIR, self.seed,
+                             self.ticks, len(self.foods))
+        foods = array("H", self.foods)
+        if sys.byteorder != "little":
+            foods.byteswap()
+        return header + foods.tobytes() + zlib.compress(bytes(self.turns), 9)
+
+    def finish(self) -> None:
+        """Write the recording once, if a path was configured."""
+        if self.finished or not self.path:
+            return
+        self.finished = True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "wb") as f:
+            f.write(self.to_bytes())
+
+
+class SnakeRecording:
+    """A decoded recording: absolute direction per tick plus food spawn cells."""
+
+    def __init__(self, seed: int, ticks: int, foods: List[Vec], dirs: bytearray,
+                 start: Vec, start_dir: int):
+        self.seed = seed
+        self.ticks = ticks
+        self.foods = foods
+        self.dirs = dirs
+        self.start = start
+        self.start_dir = start_dir
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SnakeRecording":
+        if len(data) < HEADER.size:
+            raise ValueError("not a snake recording: file too short")
+        (magic, version, grid_w, grid_h, start_x, start_y, start_dir,
+         seed, ticks, food_count) = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("not a snake recording: bad magic")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"unsupported recording version {version}")
+        if (grid_w, grid_h) != (rules.GRID_WIDTH, rules.GRID_HEIGHT):
+            raise ValueError(f"recording grid {grid_w}x{grid_h} does not match the game")
+
+        offset = HEADER.size
+        cells = array("H")
+        cells.frombytes(data[offset:offset + food_count * 2])
+        if sys.byteorder != "little":
+            cells.byteswap()
+        if len(cells) != food_count:
+            raise ValueError("truncated recording: food table")
+        foods = [(c % grid_w, c // grid_w) for c in cells]
+
+        try:
+            packed = zlib.decompress(data[offset + food_count * 2:])
+        except zlib.error:
+            raise ValueError("truncated recording: turn stream") from None
+        if len(packed) * 4 < ticks:
+            raise ValueError("truncated recording: turn stream")
+        dirs = bytearray(ticks)
+        d, t = start_dir, 0
+        for byte in packed:
+            for code in _UNPACK[byte]:
+                if t == ticks:
+                    break
+                d = (d + code) & 3
+                dirs[t] = d
+                t += 1
+        return cls(seed, ticks, foods, dirs, (start_x, start_y), start_dir)
+
+    @classmethod
+    def load(cls, path: str) -> "SnakeRecording":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+# ───────────────────────────────── Replay Engine ─────────────────────────────
+
+class SnakeState:
+    """Board state after `tick` ticks have been applied."""
+
+    def __init__(self, tick: int, snake: List[Vec], food_index: int, alive: bool, food: Vec):
+        self.tick = tick
+        self.snake = snake
+        self.score = food_index  # every food eaten advances the spawn index
+        self.food = food
+        self.alive = alive
+
+
+class SnakeReplay:
+    """Seekable replay of a SnakeRecording backed by periodic snapshots."""
+
+    def __init__(self, recording: SnakeRecording, interval: int = SNAPSHOT_INTERVAL):
+        self.recording = recording
+        self.interval = max(1, interval)
+        self.snapshots: List[Tuple[Tuple[Vec, ...], int]] = []  # (snake, food index)
+        self.death_tick: Optional[int] = None
+
+        snake = [recording.start]
+        food_index = 0
+        for start in range(0, recording.ticks, self.interval):
+            self.snapshots.append((tuple(snake), food_index))
+            food_index, died = self._run(snake, food_index, start, min(start + self.interval, recording.ticks))
+            if died is not None:
+                self.death_tick = died
+                if died != recording.ticks - 1:
+                    raise ValueError(f"recording continues after the snake died at tick {died}")
+                break
+        if food_index != len(recording.foods) - 1:
+            raise ValueError("food spawn count does not match the replayed score")
+        self.final = SnakeState(recording.ticks, snake, food_index,
+                                self.death_tick is None, recording.foods[food_index])
+
+    def _run(self, snake: List[Vec], food_index: int, start: int, end: int,
+             rng: Optional[random.Random] = None) -> Tuple[int, Optional[int]]:
+        """Apply ticks [start, end) to `snake` in place; return (food index, death tick)."""
+        dirs = self.recording.dirs
+        foods = self.recording.foods
+        directions = rules.DIRECTIONS
+        step = rules.step_snake
+        last_food = len(foods) - 1
+        for t in range(start, end):
+            result = step(snake, directions[dirs[t]], foods[food_index])
+            if result == rules.STEP_ATE:
+                if food_index == last_food:
+                    raise ValueError(f"food eaten at tick {t} has no recorded respawn")
+                food_index += 1
+                if rng is not None and rules.random_food_position(snake, rng) != foods[food_index]:
+                    raise ValueError(f"food spawn {food_index} at tick {t} does not match the seed")
+            elif result == rules.STEP_DEAD:
+                return food_index, t
+        return food_index, None
+
+    @property
+    def ticks(self) -> int:
+        return self.recording.ticks
+
+    def state_at(self, tick: int) -> SnakeState:
+        """Rebuild the board after `tick` ticks in O(snapshot interval)."""
+        tick = min(max(tick, 0), self.ticks)
+        if not self.snapshots:
+            return SnakeState(0, [self.recording.start], 0, True, self.recording.foods[0])
+        base = min(tick // self.interval, len(self.snapshots) - 1)
+        snake_tuple, food_index = self.snapshots[base]
+        snake = list(snake_tuple)
+        food_index, died = self._run(snake, food_index, base * self.interval, tick)
+        alive = died is None
+        return SnakeState(tick, snake, food_index, alive, self.recording.foods[food_index])
+
+    def play(self, start: int = 0, end: Optional[int] = None):
+        """Yield (tick, snake, food) from `start` to `end`; the snake list is updated in place."""
+        end = self.ticks if end is None else min(end, self.ticks)
+        foods = self.recording.foods
+        state = self.state_at(start)
+        snake, food_index = state.snake, state.score
+        yield state.tick, snake, foods[food_index]
+        for t in range(state.tick, end):
+            food_index, died = self._run(snake, food_index, t, t + 1)
+            if died is not None:
+                return
+            yield t + 1, snake, foods[food_index]
+
+    def fast_forward(self, verify: bool = False) -> SnakeState:
+        """Replay every tick from the start without snapshots (optionally checking the seed)."""
+        rng = None
+        if verify:
+            rng = random.Random(self.recording.seed)
+            if rules.random_food_position([self.recording.start], rng) != self.recording.foods[0]:
+                raise ValueError("initial food does not match the seed")
+        snake = [self.recording.start]
+        food_index, died = self._run(snake, 0, 0, self.ticks, rng)
+        return SnakeState(self.ticks, snake, food_index, died is None, self.recording.foods[food_index])
+
+# ────────────────────────────────── Entry Point ──────────────────────────────
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Inspect and replay snake recordings.")
+    parser.add_argument("recording", help="file written via SNAKE_RECORD")
+    parser.add_argument("--seek", type=int, help="rebuild the board after this many ticks")
+    parser.add_argument("--verify", action="store_true", help="check food spawns against the seed")
+    parser.add_argument("--screenshot", help="save the board at --seek (or the end) as an image")
+    parser.add_argument("--render", type=int, metavar="N", help="time drawing N ticks from --seek")
+    parser.add_argument("--interval", type=int, default=SNAPSHOT_INTERVAL, help="snapshot interval")
+    args = parser.parse_args(argv)
+
+    size = os.path.getsize(args.recording)
+    started = perf_counter()
+    replay = SnakeReplay(SnakeRecording.load(args.recording), args.interval)
+    loaded = perf_counter() - started
+    print(f"{args.recording}: {replay.ticks} ticks, score {replay.final.score}, "
+          f"{size} bytes, seed {replay.recording.seed}")
+    print(f"loaded with {len(replay.snapshots)} snapshots in {loaded * 1000:.1f} ms")
+
+    started = perf_counter()
+    final = replay.fast_forward(verify=args.verify)
+    elapsed = perf_counter() - started
+    rate = replay.ticks / elapsed if elapsed > 0 else float("inf")
+    print(f"fast-forward: {rate:,.0f} ticks/s" + (" (seed verified)" if args.verify else ""))
+    if final.score != replay.final.score:
+        raise SystemExit("fast-forward and snapshot replay disagree")
+
+    state = replay.final
+    if args.seek is not None:
+        started = perf_counter()
+        state = replay.state_at(args.seek)
+        print(f"seek {state.tick}: length {len(state.snake)}, score {state.score}, "
+              f"head {state.snake[0]}, food {state.food} "
+              f"({(perf_counter() - started) * 1000:.2f} ms)")
+
+    if args.screenshot or args.render:
+        # Drawing lives in the game module, which itself imports this module for the
+        # recorder; importing it only here keeps `python py_snake_game.py` single-loaded.
+        import py_snake_game as game
+        surface = pygame.Surface((game.SCREEN_WIDTH, game.SCREEN_HEIGHT))
+        if args.screenshot:
+            game.draw_board(surface, state.snake, state.food)
+            pygame.image.save(surface, args.screenshot)
+            print(f"saved {args.screenshot}")
+        if args.render:
+            samples = []
+            for _, snake, food in replay.play(state.tick, state.tick + args.render - 1):
+                started = perf_counter()
+                game.draw_board(surface, snake, food)
+                samples.append((perf_counter() - started) * 1000.0)
+            samples.sort()
+            print(f"draw over {len(samples)} ticks: p50 {percentile(samples, 50):.3f} ms, "
+                  f"p99 {percentile(samples, 99):.3f} ms, max {samples[-1]:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import random
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Snake rules shared by py_snake_game (play) and py_snake_replay (playback)
+# ──────────────────────────────────────────────────────────────────────────────
+GRID_WIDTH    = 30         # number of cells horizontally
+GRID_HEIGHT   = 30         # number of cells vertically
+START_POS     = (GRID_WIDTH // 2, GRID_HEIGHT // 2)
+
+# Directions in clockwise order; the index is what replays store per tick
+DIRECTIONS = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # U R D L
+START_DIR  = 0                                     # moving up initially
+
+# step_snake() outcomes
+STEP_MOVED = 0
+STEP_ATE   = 1
+STEP_DEAD  = 2
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Game logic
+# ──────────────────────────────────────────────────────────────────────────────
+
+def random_food_position(snake: list[tuple[int, int]], rng: random.Random = random) -> tuple[int, int]:
+    """Return a random grid position not currently occupied by the snake."""
+    while True:
+        pos = (rng.randint(0, GRID_WIDTH - 1), rng.randint(0, GRID_HEIGHT - 1))
+        if pos not in snake:
+            return pos
+
+
+def step_snake(snake: list[tuple[int, int]], direction: tuple[int, int], food: tuple[int, int]) -> int:
+    """Advance the snake one cell in place; return STEP_MOVED, STEP_ATE or STEP_DEAD."""
+    head_x, head_y = snake[0]
+    new_head = ((head_x + direction[0]) % GRID_WIDTH,
+                (head_y + direction[1]) % GRID_HEIGHT)
+
+    # Collision with self → game over (snake left unchanged)
+    if new_head in snake:
+        return STEP_DEAD
+
+    snake.insert(0, new_head)
+
+    # Check for food consumption
+    if new_head == food:
+        return STEP_ATE
+    snake.pop()  # remove tail segment when no food eaten
+    return STEP_MOVED